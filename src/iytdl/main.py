@@ -353,11 +353,11 @@ class iYTDL(Extractor, Downloader, Uploader):
         else:
             ffprobe = self._ffprobe
 
-        out_1 = await run_command(f"{ffmpeg} -version", shell=True)
+        out_1 = await run_command(str(ffmpeg), "-version")
         if out_1[1] != 0:
             raise ValueError(f"'{ffmpeg}' was not Found !")
         if ffprobe is not None:
-            out_2 = await run_command(f"{ffprobe} -version", shell=True, silent=True)
+            out_2 = await run_command(str(ffprobe), "-version", silent=True)
             if out_2[1] == 0:
                 setattr(self, "_ffprobe", ffprobe)
 
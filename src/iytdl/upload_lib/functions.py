@@ -1,4 +1,10 @@
-__all__ = ["unquote_filename", "thumb_from_audio", "covert_to_jpg", "take_screen_shot"]
+__all__ = [
+    "unquote_filename",
+    "thumb_from_audio",
+    "covert_to_jpg",
+    "take_screen_shot",
+    "save_as_jpeg",
+]
 
 import re
 import logging
@@ -16,8 +22,38 @@ from hachoir.parser import createParser
 from iytdl.upload_lib import ext
 from iytdl.utils import run_command
 
+try:
+    import numpy as np
+
+    from turbojpeg import TJPF_RGB, TurboJPEG
+
+    # Bind libjpeg-turbo once at import so every encode reuses the handle
+    _turbo_jpeg = TurboJPEG()
+except Exception:
+    _turbo_jpeg = None
+
 logger = logging.getLogger(__name__)
 
+_QUOTES_RE = re.compile(r"[\"']")
+
+
+def save_as_jpeg(img: Image.Image, path: Union[Path, str]) -> None:
+    """Encode a PIL image as JPEG via libjpeg-turbo when available
+
+    Parameters:
+    ----------
+        - img (`Image.Image`): Source image.
+        - path (`Union[Path, str]`): Output file path.
+
+    """
+    rgb = img.convert("RGB")
+    if _turbo_jpeg:
+        Path(path).write_bytes(
+            _turbo_jpeg.encode(np.asarray(rgb), quality=85, pixel_format=TJPF_RGB)
+        )
+    else:
+        rgb.save(str(path), "JPEG")
+
 
 def unquote_filename(filename: Union[Path, str]) -> Path:
     """
@@ -34,19 +70,23 @@ def unquote_filename(filename: Union[Path, str]) -> Path:
 
     """
     file = Path(filename) if isinstance(filename, str) else filename
-    un_quoted = file.parent.joinpath(re.sub(r"[\"']", "", file.name))
+    un_quoted = file.parent.joinpath(_QUOTES_RE.sub("", file.name))
     if file.name != un_quoted.name:
         file.rename(un_quoted)
         return un_quoted.absolute()
     return file.absolute()
 
 
-def thumb_from_audio(filename: Union[Path, str]) -> Optional[str]:
+def thumb_from_audio(
+    filename: Union[Path, str], audio: Optional[mutagen.FileType] = None
+) -> Optional[str]:
     """Extract album art from audio
 
     Parameters:
     ----------
         - filename (`Union[Path, str]`): audio file path.
+        - audio (`Optional[mutagen.FileType]`, optional): Pre-parsed mutagen
+            file to reuse instead of parsing `filename` again.
 
     Returns:
     -------
@@ -54,15 +94,23 @@ def thumb_from_audio(filename: Union[Path, str]) -> Optional[str]:
 
     """
     file = Path(filename) if isinstance(filename, str) else filename
-    if not (audio_id3 := mutagen.File(str(file))):
+    if not (audio_id3 := audio or mutagen.File(str(file))):
         return
     thumb_path = file.parent.joinpath("album_art.jpg")
-    for key in audio_id3.keys():
-        if "APIC" in key and (album_art := getattr(audio_id3[key], "data", None)):
-            thumb_path = file.parent.joinpath("album_art.jpg")
-            with BytesIO(album_art) as img_io:
-                with Image.open(img_io) as img:
-                    img.convert("RGB").save(str(thumb_path), "JPEG")
+    tags = getattr(audio_id3, "tags", None)
+    # ID3 keeps attached pictures under the APIC frame id -> ask for them
+    # directly instead of substring-matching every tag key
+    apic_frames = tags.getall("APIC") if hasattr(tags, "getall") else ()
+    for frame in apic_frames:
+        if album_art := getattr(frame, "data", None):
+            if album_art[:3] == b"\xff\xd8\xff":
+                # Already JPEG (common for MP3/FLAC) -> skip the
+                # decode/re-encode roundtrip
+                thumb_path.write_bytes(album_art)
+            else:
+                with BytesIO(album_art) as img_io:
+                    with Image.open(img_io) as img:
+                        save_as_jpeg(img, thumb_path)
             break
     if thumb_path.is_file():
         return str(thumb_path)
@@ -82,12 +130,22 @@ def covert_to_jpg(filename: Union[Path, str]) -> Tuple[str, Tuple[int]]:
     """
     file = Path(filename) if isinstance(filename, str) else filename
     with Image.open(file) as img:
+        # Record the real dimensions before draft() may shrink the decode
+        size = img.size
         if file.name.lower().endswith(ext.photo[:2]):
             thumb_path = str(file)
         else:
-            thumb_path = str(file.parent.joinpath(f"{file.stem}.jpeg"))
-            img.convert("RGB").save(thumb_path, "JPEG")
-        size = img.size
+            thumb = file.parent.joinpath(f"{file.stem}.jpeg")
+            thumb_path = str(thumb)
+            # Reuse the output of a previous conversion instead of paying
+            # for another decode+encode of the same source
+            if not (
+                thumb.is_file() and thumb.stat().st_mtime >= file.stat().st_mtime
+            ):
+                # For JPEG-coded sources this decodes at a reduced DCT
+                # scale; it is a no-op for other formats
+                img.draft("RGB", (1280, 1280))
+                save_as_jpeg(img, thumb_path)
     return thumb_path, size
 
 
@@ -98,7 +156,7 @@ async def get_duration(vid_path, **kwargs):
         cmd = [
             ffprobe,
             "-i",
-            f'"{str(vid_path)}"',
+            str(vid_path),
             "-v",
             "quiet",
             "-show_entries",
@@ -107,7 +165,7 @@ async def get_duration(vid_path, **kwargs):
             "-of",
             "default=noprint_wrappers=1:nokey=1",
         ]
-        _dur, _rt_code = await run_command(" ".join(cmd), shell=True, silent=True)
+        _dur, _rt_code = await run_command(*cmd, silent=True)
         return 0 if _rt_code != 0 else int(float(_dur))
     except Exception:
         return 0
@@ -130,82 +188,123 @@ async def take_screen_shot(
     """
     file = Path(video_file)
     ss_path = file.parent.joinpath(f"{file.stem}.jpg")
-    vid_path = f'"{video_file}"'
     if ttl == -1:
-        ttl = (await get_duration(vid_path, **kwargs)) // 2
+        ttl = (await get_duration(video_file, **kwargs)) // 2
     cmd = [
         str(kwargs.get("ffmpeg", "ffmpeg")),
         "-hide_banner",
-        "-loglevel error",
+        "-loglevel",
+        "error",
+        # input seeking (-ss before -i) -> demuxer jumps straight to the
+        # keyframe instead of decoding from the start
         "-ss",
         str(ttl),
         "-i",
-        vid_path,
+        str(video_file),
+        "-an",
+        "-sn",
+        "-dn",
         "-vframes",
         "1",
-        f'"{str(ss_path)}"',
+        # Telegram caps thumbnails at 320x320 -> scale in the same pass
+        # instead of uploading a full-resolution frame
+        "-vf",
+        "scale=w=320:h=320:force_original_aspect_ratio=decrease",
+        str(ss_path),
     ]
-    rt_code = (await run_command(" ".join(cmd), shell=True, silent=True))[1]
+    rt_code = (await run_command(*cmd, silent=True))[1]
     if rt_code == 0 and ss_path.is_file():
         return str(ss_path)
 
 
 async def split_video(file_path, **kwargs: Any) -> List[Path]:
-    start, cur_duration, result = 1, 0, []
+    result = []
     file = Path(file_path)
     split_size = 1.5 * 1024 * 1024 * 1024
     parts = ceil(file.stat().st_size / split_size)
     ffmpeg = str(kwargs.get("ffmpeg", "ffmpeg"))
     logger.info(f"Using FFMPEG with name : {ffmpeg}")
-    while start <= parts:
-        new_file = file.parent.joinpath(
-            "{name}.part{no}{ext}".format(
-                name=file.stem, no=str(start).zfill(3), ext=file.suffix
+    # Probe duration once, then let the segment muxer cut every part in a
+    # single ffmpeg invocation instead of one ffmpeg + ffprobe pair per part
+    duration = await get_duration(file_path, **kwargs)
+    segment_time = ceil(duration / parts) if duration else 0
+    if not segment_time:
+        logger.warning(f"Unable to probe duration of {file_path}")
+        return result
+    out_pattern = file.parent.joinpath(f"{file.stem}.part%03d{file.suffix}")
+    logger.info(f"Splitting into {parts} parts of ~{segment_time}s each")
+    cmd = [
+        ffmpeg,
+        "-i",
+        str(file_path),
+        "-map",
+        "0",
+        "-map_chapters",
+        "-1",
+        "-c",
+        "copy",
+        "-f",
+        "segment",
+        "-segment_time",
+        str(segment_time),
+        "-segment_start_number",
+        "1",
+        "-reset_timestamps",
+        "1",
+        str(out_pattern),
+    ]
+    rt_code = (await run_command(*cmd, silent=True))[1]
+    if rt_code == 0:
+        start = 1
+        while (
+            new_file := file.parent.joinpath(
+                "{name}.part{no}{ext}".format(
+                    name=file.stem, no=str(start).zfill(3), ext=file.suffix
+                )
             )
-        )
-        logger.info(f"Part No. {start} starts at {cur_duration}")
-        cmd = [
-            ffmpeg,
-            "-i",
-            f"'{file_path}'",
-            "-ss",
-            str(cur_duration),
-            "-fs",
-            str(split_size),
-            "-map_chapters",
-            "-1",
-            "-c",
-            "copy",
-            f'"{str(new_file)}"',
-        ]
-        rt_code = (await run_command(" ".join(cmd), shell=True, silent=True))[1]
-        if rt_code == 0 and new_file.is_file():
-            result.append(unquote_filename(new_file.absolute()))
-        new_duration = await get_duration(new_file, **kwargs)
-        cur_duration += new_duration
-        start += 1
-        logger.info(f"Duration of {new_file} : {new_duration}")
+        ).is_file():
+            result.append(new_file.absolute())
+            start += 1
     logger.info(f"File Splitted To : {len(result)}")
     return sorted(result)
 
 
+def _audio_artist(audio: mutagen.FileType) -> Optional[str]:
+    """Read the artist tag from a mutagen file across tag formats"""
+    if not (tags := getattr(audio, "tags", None)):
+        return None
+    for key in ("TPE1", "artist", "\xa9ART"):
+        if val := tags.get(key):
+            return str(val[0] if isinstance(val, list) else val)
+
+
 def get_metadata(media: str, media_type: str, size = None) -> dict:
     # logger.info(f"Metadata: {media}")
     new_dict = {}
-    _parser = createParser(str(Path(media).absolute()))
-    metadata = extractMetadata(_parser)
-    # logger.info(f"Metadata Info: {metadata}")
-    if metadata and metadata.has("duration"):
-        new_dict["duration"] = metadata.get("duration").seconds
+    media_path = str(Path(media).absolute())
+    try:
+        parsed = mutagen.File(media_path)
+    except Exception:
+        parsed = None
+    metadata = None
+    if parsed and getattr(parsed.info, "length", 0):
+        new_dict["duration"] = int(parsed.info.length)
+    else:
+        # mutagen doesn't understand every container (e.g. mkv/webm)
+        # -> fall back to the slower hachoir full parse
+        metadata = extractMetadata(createParser(media_path))
+        if metadata and metadata.has("duration"):
+            new_dict["duration"] = metadata.get("duration").seconds
 
     if media_type == "audio":
-        if metadata.has("artist"):
-            new_dict["performer"] = metadata.get("artist")
-        # if metadata.has("title"):
-        #    new_dict["title"] = metadata.get("title")
+        artist = _audio_artist(parsed) if parsed else None
+        if not artist and metadata and metadata.has("artist"):
+            artist = metadata.get("artist")
+        if artist:
+            new_dict["performer"] = artist
         # If Thumb doesn't exist then check for Album art
         if not new_dict.get("thumb"):
-            new_dict["thumb"] = thumb_from_audio(media)
+            new_dict["thumb"] = thumb_from_audio(media, audio=parsed)
     else:
         width, height = size or (1280, 720)
         new_dict["height"] = height
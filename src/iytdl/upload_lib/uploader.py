@@ -28,7 +28,6 @@ from iytdl.upload_lib.functions import (
     split_video,
     take_screen_shot,
     get_metadata,
-    unquote_filename,
     covert_to_jpg,
 )  # noqa ignore=F405
 from iytdl.upload_lib.progress import progress as upload_progress
@@ -73,15 +72,26 @@ class Uploader:
         if not media_path.is_dir():
             raise FileNotFoundError(f"'{media_path}' doesn't exist !")
         info_dict: Dict = {}
-        for file in media_path.iterdir():
+        # Visit files with a matching media/photo suffix first so the loop
+        # can break before stat-ing unrelated files (subs, json, etc.)
+        media_ext = getattr(ext, media_type)
+        entries = sorted(
+            os.scandir(media_path),
+            key=lambda e: not e.name.lower().endswith(media_ext + ext.photo),
+        )
+        found_media = found_thumb = False
+        for entry in entries:
+            # DirEntry carries cached stat info -> one stat(2) per file at most
+            file = Path(entry.path)
+            name_lower = entry.name.lower()
             if (
-                not info_dict.get(media_type)
-                and file.name.lower().endswith(getattr(ext, media_type))
-                and file.stat().st_size != 0
+                not found_media
+                and name_lower.endswith(media_ext)
+                and (st_size := entry.stat().st_size) != 0
             ):
-                file = unquote_filename(file.absolute())
+                file = file.absolute()
                 if (
-                    file.stat().st_size > 2147000000 and media_type == "video"
+                    st_size > 2147000000 and media_type == "video"
                 ):  # 2 * 1024 * 1024 * 1024 = 2147483648
                     # raise ValueError(f"[{file}] will not be uploaded as filesize exceeds '2 GB', file size is {file.stat().st_size} !")
                     f_path = await split_video(
@@ -96,13 +106,15 @@ class Uploader:
                     info_dict["file_name"] = os.path.basename(f_path)
                     info_dict["is_split"] = False
                 info_dict[media_type] = f_path
+                found_media = True
 
-            if not info_dict.get("thumb") and file.name.lower().endswith(ext.photo):
-                info_dict["thumb"], info_dict["size"] = covert_to_jpg(
+            if not found_thumb and name_lower.endswith(ext.photo):
+                info_dict["thumb"], info_dict["size"] = await run_sync(covert_to_jpg)(
                     file[0] if isinstance(file, list) else file
                 )
+                found_thumb = True
 
-            if media_type in info_dict and "thumb" in info_dict:
+            if found_media and found_thumb:
                 break
 
         return info_dict
@@ -236,27 +248,43 @@ class Uploader:
 
             uploaded = []
             videos, videos_name = mkwargs.pop("video"), mkwargs.pop("file_name")
-            nums = 1
             size = mkwargs.pop("size", (1280, 720))
-            for file, file_name in zip(videos, videos_name):
+            first_thumb = mkwargs.pop("thumb", None)
+            # Extract metadata first so its duration drives the screenshot
+            # seek -> no separate ffprobe run per part
+            metas = await asyncio.gather(
+                *(
+                    run_sync(get_metadata)(file, media_type, size=size)
+                    for file in videos
+                )
+            )
+
+            async def part_thumb(part, meta):
+                ttl = (duration // 2) if (duration := meta.get("duration")) else -1
+                return await take_screen_shot(
+                    part,
+                    ttl,
+                    ffmpeg=self._ffmpeg,
+                    ffprobe=getattr(self, "_ffprobe", None),
+                )
+
+            if first_thumb:
+                # A found thumbnail applies to the whole video, not just the
+                # first part -> reuse it instead of screenshotting the rest
+                thumbs = [first_thumb] * len(videos)
+            else:
+                # Screenshot every part concurrently instead of one ffmpeg
+                # at a time inside the upload loop
+                thumbs = await asyncio.gather(*map(part_thumb, videos, metas))
+            for nums, (file, file_name, thumb, meta) in enumerate(
+                zip(videos, videos_name, thumbs, metas), start=1
+            ):
                 caption = (
                     f"<a href={caption_link}>{file_name}</a>"
                     if caption_link
                     else f"<code>{file_name}</code>"
                 )
                 total_file = {"all_videos": len(videos), "now_video": nums}
-                thumb = mkwargs.pop("thumb", None)
-                if not thumb:
-                    ttl = (
-                        (duration // 2) if (duration := mkwargs.get("duration")) else -1
-                    )
-                    thumb = await take_screen_shot(
-                        file,
-                        ttl,
-                        ffmpeg=self._ffmpeg,
-                        ffprobe=getattr(self, "_ffprobe", None),
-                    )
-                meta = get_metadata(file, media_type, size=size)
                 mkwargs.update(meta)
                 uploaded.append(
                     await send_video(
@@ -272,10 +300,9 @@ class Uploader:
                         **mkwargs,
                     )
                 )
-                nums += 1
         else:
             size = mkwargs.pop("size", (1280, 720))
-            meta = get_metadata(mkwargs["video"], media_type, size=size)
+            meta = await run_sync(get_metadata)(mkwargs["video"], media_type, size=size)
             mkwargs.update(meta)
             if not mkwargs.get("thumb"):
                 ttl = (duration // 2) if (duration := mkwargs.get("duration")) else -1
@@ -369,7 +396,7 @@ class Uploader:
             else f"<code>{mkwargs['file_name']}</code>"
         )
         size = mkwargs.pop("size", (1280, 720))
-        meta = get_metadata(mkwargs[media_type], media_type, size=size)
+        meta = await run_sync(get_metadata)(mkwargs[media_type], media_type, size=size)
         mkwargs |= meta
         uploaded = await client.send_audio(
             chat_id=self.log_group_id,